@@ -1,23 +1,193 @@
 """Trajectory API endpoints for computing transfer orbits."""
-from flask import Blueprint, request, jsonify
-from backend.trajectory_solver import get_trajectory_solver
+import base64
+import functools
+import hashlib
+import multiprocessing
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+from flask import Blueprint, Response, current_app, request, jsonify
+from backend.trajectory_solver import get_trajectory_solver, pack_planet_positions
 from backend.game_data_loader import get_game_data_loader
+from backend import json_provider
 
 trajectory_bp = Blueprint('trajectory', __name__)
 
 
+@trajectory_bp.before_request
+def _limit_content_length():
+    """Reject oversized request bodies before they are read or parsed."""
+    max_length = current_app.config.get('TRAJECTORY_MAX_CONTENT_LENGTH')
+    if max_length and request.content_length and request.content_length > max_length:
+        return jsonify({
+            'error': f'Request body too large (max {max_length} bytes)'
+        }), 413
+
+
+@functools.lru_cache(maxsize=1)
 def _get_solver():
-    """Get trajectory solver with orbital zone data."""
-    data_loader = get_game_data_loader()
-    orbital_zones = data_loader.load_orbital_mechanics()
+    """
+    Get trajectory solver with orbital zone data.
+    
+    The solver is built once and reused across requests. Call
+    _get_solver.cache_clear() after reloading orbital zone data to rebuild it.
+    """
+    return get_trajectory_solver(get_game_data_loader().load_orbital_zones_by_id())
+
+
+def warm_up_solver():
+    """
+    Build the solver and run one small transfer.
+    
+    Called before serving, and in each /batch worker process, so the first
+    request doesn't pay for loading zone data, importing poliastro, or
+    JIT-compiling its Lambert solver.
+    """
+    _get_solver().compute_transfer('earth', 'mars', 0, 10, None)
+
+
+TransferArgs = namedtuple('TransferArgs', [
+    'from_zone', 'to_zone', 'via_zone', 'game_time_days', 'num_points', 'planet_positions'
+])
+
+
+class TransferArgsError(ValueError):
+    """A trajectory request body could not be parsed; reported as a 400."""
+
+
+@trajectory_bp.errorhandler(TransferArgsError)
+def _transfer_args_error(e):
+    return jsonify({'error': str(e)}), 400
+
+
+def _parse_transfer_args(data, default_points=50, max_points=200):
+    """
+    Extract transfer parameters from a request body, clamping num_points.
+    
+    planet_positions is packed into a zone ID list and an (N, 2) array.
+    Raises TransferArgsError if a planet position is not an [x, y] pair.
+    """
+    get = data.get
+    try:
+        # Optional: actual positions from frontend
+        planet_positions = pack_planet_positions(get('planet_positions'))
+    except ValueError as e:
+        raise TransferArgsError(str(e)) from e
+    
+    return TransferArgs(
+        get('from_zone'),
+        get('to_zone'),
+        get('via_zone'),
+        get('game_time_days', 0),
+        # Limit num_points for performance
+        min(max(10, get('num_points', default_points)), max_points),
+        planet_positions
+    )
+
+
+def _encode_points(trajectory):
+    """
+    Replace trajectory_points_au with base64-encoded little-endian float32 x, y pairs.
+    
+    Packed binary is about a quarter of the size of nested JSON lists and the
+    frontend decodes it straight into a Float32Array. Returns a shallow copy,
+    with gravity assist legs encoded too; error entries are returned unchanged.
+    """
+    points = trajectory.get('trajectory_points_au')
+    if points is None:
+        return trajectory
+    
+    encoded = dict(trajectory)
+    del encoded['trajectory_points_au']
+    encoded['trajectory_points_au_b64'] = base64.b64encode(
+        np.asarray(points, dtype='<f4').tobytes()
+    ).decode('ascii')
+    encoded['trajectory_points_count'] = len(points)
+    
+    for leg in ('leg1', 'leg2'):
+        if leg in encoded:
+            encoded[leg] = _encode_points(encoded[leg])
+    
+    return encoded
+
+
+_BATCH_WORKERS = os.cpu_count() or 1
+
+# Worker processes solve /batch cache misses in parallel, since poliastro holds
+# the GIL. They are spawned rather than forked because the server is threaded,
+# only on first submit, and warm up their own solver as they start. With a
+# single CPU misses are solved inline.
+_batch_executor = ProcessPoolExecutor(
+    max_workers=_BATCH_WORKERS,
+    mp_context=multiprocessing.get_context('spawn'),
+    initializer=warm_up_solver
+) if _BATCH_WORKERS > 1 else None
+
+
+def _solve_transfers(solver, game_time_days, num_points, planet_positions, transfers):
+    """
+    Compute a list of /batch request entries, in order.
+    
+    Direct and gravity assist transfers are each solved with a single bulk
+    solver call, then reassembled in the original order. The solver checks its
+    result cache first and hands only the misses to the batch worker processes.
+    """
+    trajectories = [None] * len(transfers)
+    direct = []
+    assisted = []
     
-    # Convert orbital zones list to dictionary keyed by ID
-    zones_dict = {}
-    if orbital_zones:
-        for zone in orbital_zones:
-            zones_dict[zone['id']] = zone
+    for i, transfer in enumerate(transfers):
+        # Malformed entries get their own error rather than failing the batch
+        if not isinstance(transfer, dict):
+            trajectories[i] = {
+                'error': 'transfer must be an object'
+            }
+        elif not transfer.get('from_zone') or not transfer.get('to_zone'):
+            trajectories[i] = {
+                'error': 'from_zone and to_zone required'
+            }
+        elif not all(isinstance(transfer.get(key) or '', str) for key in ('from_zone', 'to_zone', 'via_zone')):
+            trajectories[i] = {
+                'error': 'zone IDs must be strings'
+            }
+        elif transfer.get('via_zone'):
+            assisted.append(i)
+        else:
+            direct.append(i)
+    
+    # The vectorized fallback solver is faster inline than pickled to a worker
+    executor = _batch_executor if solver.use_poliastro else None
+    
+    if direct:
+        # Direct transfers
+        results = solver.compute_transfer_bulk(
+            [transfers[i]['from_zone'] for i in direct],
+            [transfers[i]['to_zone'] for i in direct],
+            game_time_days,
+            num_points,
+            planet_positions,
+            executor
+        )
+        for i, traj in zip(direct, results):
+            trajectories[i] = traj
+    
+    if assisted:
+        # Gravity assist transfers
+        results = solver.compute_gravity_assist_transfer_bulk(
+            [transfers[i]['from_zone'] for i in assisted],
+            [transfers[i]['to_zone'] for i in assisted],
+            [transfers[i]['via_zone'] for i in assisted],
+            game_time_days,
+            num_points,
+            planet_positions,
+            executor
+        )
+        for i, traj in zip(assisted, results):
+            trajectories[i] = traj
     
-    return get_trajectory_solver(zones_dict)
+    return trajectories
 
 
 @trajectory_bp.route('/compute', methods=['POST'])
@@ -49,42 +219,37 @@ def compute_transfer():
             "transfer_time_days": 258.8,
             "departure_position_au": [1.0, 0.0],
             "arrival_position_au": [-1.52, 0.0],
-            "trajectory_points_au": [[x, y], ...],
+            "trajectory_points_au_b64": "...",  // little-endian float32 x, y pairs
+            "trajectory_points_count": 50,
             "delta_v_km_s": 5.57
         }
     }
     """
-    data = request.get_json()
+    data = request.get_json(cache=False, silent=True)
     
     if not data:
         return jsonify({'error': 'No data provided'}), 400
     
-    from_zone = data.get('from_zone')
-    to_zone = data.get('to_zone')
+    args = _parse_transfer_args(data)
     
-    if not from_zone or not to_zone:
+    if not args.from_zone or not args.to_zone:
         return jsonify({'error': 'from_zone and to_zone are required'}), 400
     
-    game_time_days = data.get('game_time_days', 0)
-    num_points = data.get('num_points', 50)
-    planet_positions = data.get('planet_positions')  # Optional: actual positions from frontend
-    
-    # Limit num_points for performance
-    num_points = min(max(10, num_points), 200)
+    # Solver setup errors are server faults, not trajectory failures
+    solver = _get_solver()
     
     try:
-        solver = _get_solver()
         trajectory = solver.compute_transfer(
-            from_zone=from_zone,
-            to_zone=to_zone,
-            game_time_days=game_time_days,
-            num_points=num_points,
-            planet_positions=planet_positions
+            args.from_zone,
+            args.to_zone,
+            args.game_time_days,
+            args.num_points,
+            args.planet_positions
         )
         
         return jsonify({
             'success': True,
-            'trajectory': trajectory
+            'trajectory': _encode_points(trajectory)
         })
         
     except Exception as e:
@@ -105,7 +270,11 @@ def compute_gravity_assist():
         "to_zone": "jupiter",
         "via_zone": "venus",     // gravity assist body
         "game_time_days": 0,     // optional
-        "num_points": 50         // optional
+        "num_points": 50,        // optional
+        "planet_positions": {    // optional, actual planet positions from frontend
+            "earth": [1.0, 0.0],
+            ...
+        }
     }
     
     Response:
@@ -115,44 +284,42 @@ def compute_gravity_assist():
             "from_zone": "earth",
             "to_zone": "jupiter",
             "via_zone": "venus",
-            "trajectory_points_au": [[x, y], ...],
+            "trajectory_points_au_b64": "...",  // little-endian float32 x, y pairs
+            "trajectory_points_count": 50,
             "total_delta_v_km_s": 8.2,
             "gravity_assist_bonus_km_s": 2.5,
             "is_gravity_assist": true
         }
     }
     """
-    data = request.get_json()
+    data = request.get_json(cache=False, silent=True)
     
     if not data:
         return jsonify({'error': 'No data provided'}), 400
     
-    from_zone = data.get('from_zone')
-    to_zone = data.get('to_zone')
-    via_zone = data.get('via_zone')
+    args = _parse_transfer_args(data)
     
-    if not from_zone or not to_zone or not via_zone:
+    if not args.from_zone or not args.to_zone or not args.via_zone:
         return jsonify({
             'error': 'from_zone, to_zone, and via_zone are required'
         }), 400
     
-    game_time_days = data.get('game_time_days', 0)
-    num_points = data.get('num_points', 50)
-    num_points = min(max(10, num_points), 200)
+    # Solver setup errors are server faults, not trajectory failures
+    solver = _get_solver()
     
     try:
-        solver = _get_solver()
         trajectory = solver.compute_gravity_assist_transfer(
-            from_zone=from_zone,
-            to_zone=to_zone,
-            via_zone=via_zone,
-            game_time_days=game_time_days,
-            num_points=num_points
+            args.from_zone,
+            args.to_zone,
+            args.via_zone,
+            args.game_time_days,
+            args.num_points,
+            args.planet_positions
         )
         
         return jsonify({
             'success': True,
-            'trajectory': trajectory
+            'trajectory': _encode_points(trajectory)
         })
         
     except Exception as e:
@@ -183,20 +350,19 @@ def compute_batch():
         }
     }
     
-    Response:
+    Response (streamed as trajectories complete):
     {
-        "success": true,
         "trajectories": [
             {...trajectory data...},
             ...
         ],
+        "success": true,
         "computation_time_ms": 123.45
     }
     """
-    import time
     start_time = time.perf_counter()
     
-    data = request.get_json()
+    data = request.get_json(cache=False, silent=True)
     
     if not data or 'transfers' not in data:
         return jsonify({'error': 'transfers array is required'}), 400
@@ -211,61 +377,110 @@ def compute_batch():
             'error': 'Maximum 20 transfers per batch'
         }), 400
     
-    game_time_days = data.get('game_time_days', 0)
-    num_points = min(max(10, data.get('num_points', 30)), 100)
-    planet_positions = data.get('planet_positions')  # Optional: actual positions from frontend
+    args = _parse_transfer_args(data, default_points=30, max_points=100)
     
-    try:
-        solver = _get_solver()
-        trajectories = []
-        
-        for transfer in transfers:
-            from_zone = transfer.get('from_zone')
-            to_zone = transfer.get('to_zone')
-            via_zone = transfer.get('via_zone')
-            
-            if not from_zone or not to_zone:
-                trajectories.append({
-                    'error': 'from_zone and to_zone required'
-                })
-                continue
-            
-            if via_zone:
-                # Gravity assist transfer
-                traj = solver.compute_gravity_assist_transfer(
-                    from_zone=from_zone,
-                    to_zone=to_zone,
-                    via_zone=via_zone,
-                    game_time_days=game_time_days,
-                    num_points=num_points,
-                    planet_positions=planet_positions
-                )
-            else:
-                # Direct transfer
-                traj = solver.compute_transfer(
-                    from_zone=from_zone,
-                    to_zone=to_zone,
-                    game_time_days=game_time_days,
-                    num_points=num_points,
-                    planet_positions=planet_positions
-                )
-            
-            trajectories.append(traj)
-        
-        end_time = time.perf_counter()
-        computation_time_ms = (end_time - start_time) * 1000
+    solve = functools.partial(
+        _solve_transfers,
+        _get_solver(),
+        args.game_time_days,
+        args.num_points,
+        args.planet_positions
+    )
+    
+    # Solve each distinct transfer once and fan the result out
+    unique_transfers, unique_index = _dedupe_transfers(transfers)
+    jobs = [(len(unique_transfers), functools.partial(solve, unique_transfers))]
+    
+    return Response(_stream_batch(jobs, unique_index, start_time), mimetype='application/json')
+
+
+def _dedupe_transfers(transfers):
+    """
+    Collapse identical /batch entries.
+    
+    Returns the distinct transfers in first-seen order, and for each original
+    entry the index of its distinct transfer.
+    """
+    seen = {}
+    unique_transfers = []
+    unique_index = []
+    
+    for transfer in transfers:
+        try:
+            key = (transfer.get('from_zone'), transfer.get('to_zone'), transfer.get('via_zone'))
+            index = seen.setdefault(key, len(unique_transfers))
+        except (AttributeError, TypeError):
+            # Non-object entries and unhashable zones are kept apart for _solve_transfers to report
+            index = len(unique_transfers)
         
-        return jsonify({
-            'success': True,
-            'trajectories': trajectories,
-            'computation_time_ms': computation_time_ms
-        })
+        if index == len(unique_transfers):
+            unique_transfers.append(transfer)
+        unique_index.append(index)
+    
+    return unique_transfers, unique_index
+
+
+def _stream_batch(jobs, unique_index, start_time):
+    """
+    Yield the /batch JSON response, writing trajectories as their chunks complete.
+    
+    Each distinct trajectory is serialized once and written for every request
+    entry that maps to it, in request order. The status line has already been
+    sent by the time a chunk fails, so a failed chunk reports per-transfer
+    errors and the trailing "success" is false.
+    """
+    error = None
+    separator = b''
+    encoded = []
+    written = 0
+    
+    yield b'{"trajectories":['
+    for size, job in jobs:
+        try:
+            chunk_trajectories = job()
+        except Exception as e:
+            error = str(e)
+            chunk_trajectories = [{'error': error}] * size
+        encoded.extend(json_provider.dumps(_encode_points(traj)) for traj in chunk_trajectories)
         
-    except Exception as e:
-        return jsonify({
-            'success': False,
-            'error': str(e)
-        }), 500
+        # Distinct transfers are numbered in first-seen order, so every entry up
+        # to the first one still being solved can be written now
+        while written < len(unique_index) and unique_index[written] < len(encoded):
+            yield separator + encoded[unique_index[written]]
+            separator = b','
+            written += 1
+    
+    end_time = time.perf_counter()
+    summary = {
+        'success': error is None,
+        'computation_time_ms': (end_time - start_time) * 1000
+    }
+    if error is not None:
+        summary['error'] = error
+    
+    # Splice the summary fields in after the trajectories array
+    yield b'],' + json_provider.dumps(summary)[1:]
+
+
+@functools.lru_cache(maxsize=1)
+def _zones_payload():
+    """
+    Get the serialized /zones response body and its ETag.
+    
+    Orbital zones are static at runtime, so the body is built once. Raises
+    ValueError if no zone data is available; failures are not cached, so the
+    next request tries again.
+    """
+    data_loader = get_game_data_loader()
+    orbital_zones = data_loader.load_orbital_mechanics()
+    if not orbital_zones:
+        raise ValueError('No orbital zone data available')
+    
+    body = json_provider.dumps({
+        'success': True,
+        'zones': orbital_zones
+    })
+    return body, hashlib.sha256(body).hexdigest()
 
 
 @trajectory_bp.route('/zones', methods=['GET'])
@@ -288,23 +503,15 @@ def get_zones():
     }
     """
     try:
-        data_loader = get_game_data_loader()
-        orbital_zones = data_loader.load_orbital_mechanics()
-        
-        if orbital_zones:
-            return jsonify({
-                'success': True,
-                'zones': orbital_zones
-            })
-        else:
-            return jsonify({
-                'success': False,
-                'error': 'No orbital zone data available'
-            }), 500
-            
+        body, etag = _zones_payload()
     except Exception as e:
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
-
+    
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = 3600
+    return response.make_conditional(request)
@@ -2,11 +2,13 @@
 from flask import Flask
 from flask_cors import CORS
 from flask_migrate import Migrate
+from werkzeug.serving import is_running_from_reloader
 import os
 
 from backend.config import config
 from backend.models import db, bcrypt
 from backend.game_data_loader import get_game_data_loader
+from backend.json_provider import OrjsonProvider
 
 def create_app(config_name=None):
     """Create and configure Flask application."""
@@ -19,6 +21,7 @@ def create_app(config_name=None):
                 static_folder=static_folder,
                 static_url_path='/static',
                 template_folder=template_folder)
+    app.json = OrjsonProvider(app)
     
     # Load configuration
     if config_name is None:
@@ -74,9 +77,28 @@ def create_app(config_name=None):
     
     return app
 
+def warm_up_trajectory_solver(app, use_reloader=False):
+    """
+    Warm the trajectory solver so the first request doesn't hit a cold start.
+    
+    Call just before app.run(), so CLI commands don't pay for it. Under the
+    reloader only the child process serves requests, so the parent skips it.
+    """
+    if not app.config.get('TRAJECTORY_WARMUP'):
+        return
+    if use_reloader and not is_running_from_reloader():
+        return
+    
+    from backend.api.trajectory import warm_up_solver
+    try:
+        warm_up_solver()
+    except Exception as e:
+        app.logger.warning(f"Trajectory solver warm-up failed: {e}")
+
 if __name__ == '__main__':
     import os
     app = create_app()
     port = int(os.environ.get('PORT', 5001))
+    warm_up_trajectory_solver(app, use_reloader=True)
     app.run(debug=True, host='0.0.0.0', port=port)
 
@@ -12,6 +12,13 @@ class Config:
         os.environ.get('SQLALCHEMY_DATABASE_URI') or \
         'sqlite:///brachisto_probe.db'  # Use SQLite for development
     
+    # Request body limits (bytes)
+    MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # Game state saves can be large
+    TRAJECTORY_MAX_CONTENT_LENGTH = 64 * 1024  # Plenty for a 20-transfer batch
+    
+    # Run one trajectory solve before serving to pay data loading and JIT costs up front
+    TRAJECTORY_WARMUP = True
+    
     # Game configuration
     DYSON_SPHERE_TARGET_MASS = 20e22  # kg, base value (can be reduced by research)
     INITIAL_PROBES = 10  # Default starting probes (overridden by difficulty config)
@@ -68,6 +75,7 @@ class TestingConfig(Config):
     """Testing configuration."""
     TESTING = True
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    TRAJECTORY_WARMUP = False
 
 config = {
     'development': DevelopmentConfig,
@@ -30,6 +30,7 @@ class GameDataLoader:
             self.data_dir = Path(data_dir)
         
         self._orbital_zones = None
+        self._orbital_zones_by_id = None
         self._buildings = None
         self._research_trees = None
         self._zone_metal_limits = None
@@ -42,6 +43,7 @@ class GameDataLoader:
             with open(file_path, 'r') as f:
                 data = json.load(f)
                 self._orbital_zones = data['orbital_zones']
+                self._orbital_zones_by_id = {zone['id']: zone for zone in self._orbital_zones}
                 
                 # Calculate metal limits per zone based on true planetary masses
                 self._zone_metal_limits = {}
@@ -58,6 +60,12 @@ class GameDataLoader:
                 
         return self._orbital_zones
     
+    def load_orbital_zones_by_id(self):
+        """Load orbital zones as a dictionary keyed by zone ID."""
+        if self._orbital_zones_by_id is None:
+            self.load_orbital_mechanics()
+        return self._orbital_zones_by_id
+    
     def get_zone_metal_limit(self, zone_id):
         """Get metal limit for a specific zone."""
         if self._zone_metal_limits is None:
@@ -66,12 +74,7 @@ class GameDataLoader:
     
     def get_zone_by_id(self, zone_id):
         """Get orbital zone data by ID."""
-        if self._orbital_zones is None:
-            self.load_orbital_mechanics()
-        for zone in self._orbital_zones:
-            if zone['id'] == zone_id:
-                return zone
-        return None
+        return self.load_orbital_zones_by_id().get(zone_id)
     
     def load_buildings(self):
         """Load buildings data."""
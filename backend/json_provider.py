@@ -0,0 +1,59 @@
+"""orjson-backed JSON serialization for Flask requests and responses."""
+import decimal
+import json
+
+import numpy as np
+import orjson
+from flask.json.provider import JSONProvider
+
+# numpy arrays are serialized in C; int dict keys are stringified like stdlib json
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj):
+    """Serialize types orjson does not support natively."""
+    if isinstance(obj, (np.ndarray, np.generic)):
+        # Only reached from the stdlib fallback; orjson handles numpy itself
+        return obj.tolist()
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj):
+    """Serialize obj to JSON bytes."""
+    try:
+        return orjson.dumps(obj, default=_default, option=ORJSON_OPTIONS)
+    except TypeError:
+        # orjson rejects ints beyond 64 bits (e.g. in older saved game states),
+        # which stdlib json handles
+        return json.dumps(obj, default=_default, separators=(',', ':')).encode()
+
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider that parses and serializes with orjson, including numpy arrays."""
+
+    def dumps(self, obj, **kwargs):
+        """Serialize obj to a JSON string."""
+        if kwargs:
+            # orjson takes no encoder options such as indent or sort_keys;
+            # honor them with the stdlib encoder
+            kwargs.setdefault('default', _default)
+            return json.dumps(obj, **kwargs)
+        return dumps(obj).decode()
+
+    def loads(self, s, **kwargs):
+        """Deserialize a JSON string or bytes."""
+        if kwargs:
+            # orjson takes no decoder options; honor them with the stdlib parser
+            return json.loads(s, **kwargs)
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """Build a JSON response without round-tripping the bytes through str."""
+        # _prepare_response_obj is private to Flask's JSONProvider (Flask 2.2+);
+        # it maps jsonify()'s positional and keyword arguments to one object
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps(obj), mimetype='application/json')
@@ -6,8 +6,12 @@ Supports direct Hohmann-like transfers and multi-leg gravity assist trajectories
 """
 
 import numpy as np
-from typing import List, Tuple, Optional, Dict, Any
+from typing import List, Tuple, Optional, Dict, Any, Sequence, Union, Hashable
+from collections import OrderedDict
+from concurrent.futures import Executor
+import copy
 import math
+import threading
 
 try:
     from astropy import units as u
@@ -24,6 +28,34 @@ except ImportError:
 AU_M = 149597870700  # Astronomical unit in meters
 SUN_MU = 1.32712440018e20  # Sun's gravitational parameter (m³/s²)
 
+# Actual planet positions from the frontend, either as a {zone_id: [x, y]} dict
+# or packed by pack_planet_positions() into (zone_ids, (N, 2) float64 array)
+PlanetPositions = Union[Dict[str, Tuple[float, float]], Tuple[List[str], np.ndarray]]
+
+
+def pack_planet_positions(planet_positions: Optional[PlanetPositions]) -> Optional[Tuple[List[str], np.ndarray]]:
+    """
+    Pack a {zone_id: [x, y]} dict into a zone ID list and one contiguous (N, 2) array.
+    
+    Already packed positions and None are returned unchanged.
+    
+    Raises:
+        ValueError: If planet_positions is not a dict of [x, y] number pairs
+    """
+    if planet_positions is None or isinstance(planet_positions, tuple):
+        return planet_positions
+    if not isinstance(planet_positions, dict):
+        raise ValueError("planet_positions must map zone IDs to [x, y]")
+    
+    names = list(planet_positions)
+    try:
+        coords = np.asarray(list(planet_positions.values()), dtype=np.float64).reshape(len(names), 2)
+    except (TypeError, ValueError) as e:
+        raise ValueError("planet_positions values must be [x, y] pairs of numbers") from e
+    if not np.isfinite(coords).all():
+        raise ValueError("planet_positions values must be finite numbers")
+    return names, coords
+
 
 class TrajectorySolver:
     """
@@ -42,6 +74,10 @@ class TrajectorySolver:
         """
         self.orbital_zones = orbital_zones or {}
         self.use_poliastro = POLIASTRO_AVAILABLE
+        
+        # LRU cache of compute_transfer() results, see _transfer_cache_key()
+        self._transfer_cache: "OrderedDict[Hashable, Dict[str, Any]]" = OrderedDict()
+        self._transfer_cache_lock = threading.Lock()
     
     def get_zone_radius_au(self, zone_id: str) -> float:
         """Get orbital radius in AU for a zone."""
@@ -71,32 +107,6 @@ class TrajectorySolver:
             return self.orbital_zones[zone_id].get('total_mass_kg', 0)
         return 0
     
-    def get_planet_position(self, radius_au: float, game_time_days: float, 
-                           initial_angle: float = 0) -> Tuple[float, float]:
-        """
-        Calculate planet position at a given game time.
-        
-        Uses Kepler's third law: T² ∝ a³
-        
-        Args:
-            radius_au: Orbital radius in AU
-            game_time_days: Game time in days since epoch
-            initial_angle: Initial angular position in radians
-            
-        Returns:
-            (x, y) position in AU
-        """
-        # Orbital period in days: T = 365.25 * a^(3/2)
-        period_days = 365.25 * (radius_au ** 1.5)
-        
-        # Angular position
-        theta = initial_angle + 2 * math.pi * (game_time_days / period_days)
-        
-        x = radius_au * math.cos(theta)
-        y = radius_au * math.sin(theta)
-        
-        return (x, y)
-    
     def solve_lambert(self, r1_au: Tuple[float, float], r2_au: Tuple[float, float],
                       tof_days: float, prograde: bool = True) -> Optional[Dict[str, Any]]:
         """
@@ -113,8 +123,12 @@ class TrajectorySolver:
         """
         if self.use_poliastro:
             return self._solve_lambert_poliastro(r1_au, r2_au, tof_days, prograde)
-        else:
-            return self._solve_lambert_fallback(r1_au, r2_au, tof_days, prograde)
+        
+        # The fallback has no short/long way distinction
+        r1 = np.array([r1_au], dtype=float)
+        r2 = np.array([r2_au], dtype=float)
+        bulk = self._solve_lambert_bulk_fallback(r1, r2, np.array([tof_days]))
+        return self._lambert_solution(bulk, 0, r1[0], r2[0], tof_days)
     
     def _solve_lambert_poliastro(self, r1_au: Tuple[float, float], 
                                   r2_au: Tuple[float, float],
@@ -179,35 +193,6 @@ class TrajectorySolver:
             print(f"Lambert solver error: {e}")
             return None
     
-    def _solve_lambert_fallback(self, r1_au: Tuple[float, float], 
-                                 r2_au: Tuple[float, float],
-                                 tof_days: float, prograde: bool) -> Optional[Dict[str, Any]]:
-        """
-        Fallback Lambert solver using simplified ellipse calculation.
-        Less accurate but works without poliastro.
-        """
-        r1_m = math.sqrt(r1_au[0]**2 + r1_au[1]**2) * AU_M
-        r2_m = math.sqrt(r2_au[0]**2 + r2_au[1]**2) * AU_M
-        
-        # Semi-major axis of transfer ellipse (assuming Hohmann-like)
-        a = (r1_m + r2_m) / 2
-        
-        # Hohmann delta-v calculation
-        dv1 = math.sqrt(SUN_MU / r1_m) * (math.sqrt(2 * r2_m / (r1_m + r2_m)) - 1)
-        dv2 = math.sqrt(SUN_MU / r2_m) * (1 - math.sqrt(2 * r1_m / (r1_m + r2_m)))
-        
-        return {
-            'v1': [0, 0, 0],  # Placeholder
-            'v2': [0, 0, 0],
-            'dv1_ms': abs(dv1),
-            'dv2_ms': abs(dv2),
-            'total_dv_ms': abs(dv1) + abs(dv2),
-            'total_dv_km_s': (abs(dv1) + abs(dv2)) / 1000,
-            'r1_au': list(r1_au),
-            'r2_au': list(r2_au),
-            'tof_days': tof_days
-        }
-    
     def generate_trajectory_points(self, r1_au: Tuple[float, float], 
                                     r2_au: Tuple[float, float],
                                     tof_days: float, 
@@ -226,79 +211,153 @@ class TrajectorySolver:
         Returns:
             List of (x, y) positions in AU
         """
-        r1 = np.array(r1_au)
-        r2 = np.array(r2_au)
-        
-        r1_mag = np.linalg.norm(r1)
-        r2_mag = np.linalg.norm(r2)
+        points = self.generate_trajectory_points_bulk(
+            np.array([r1_au], dtype=float), np.array([r2_au], dtype=float), num_points
+        )[0]
+        return [tuple(point) for point in points.tolist()]
+    
+    def solve_lambert_bulk(self, r1_au: np.ndarray, r2_au: np.ndarray,
+                           tof_days: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Solve Lambert's problem for many transfers at once.
         
-        # Calculate the transfer angle
-        cos_theta = np.dot(r1, r2) / (r1_mag * r2_mag)
-        cos_theta = np.clip(cos_theta, -1, 1)
-        transfer_angle = np.arccos(cos_theta)
+        Args:
+            r1_au: Departure positions in AU, shape (N, 2)
+            r2_au: Arrival positions in AU, shape (N, 2)
+            tof_days: Times of flight in days, shape (N,)
+            
+        Returns:
+            Dictionary of stacked arrays: 'v1' and 'v2' velocities (N, 3) in m/s,
+            'dv1_ms' and 'dv2_ms' (N,), and a 'valid' mask (N,) of solved transfers
+        """
+        if self.use_poliastro:
+            return self._solve_lambert_bulk_poliastro(r1_au, r2_au, tof_days)
+        else:
+            return self._solve_lambert_bulk_fallback(r1_au, r2_au, tof_days)
+    
+    def _solve_lambert_bulk_poliastro(self, r1_au: np.ndarray, r2_au: np.ndarray,
+                                       tof_days: np.ndarray) -> Dict[str, np.ndarray]:
+        """Solve Lambert's problem for each transfer using poliastro."""
+        n = len(tof_days)
+        result = {
+            'v1': np.zeros((n, 3)),
+            'v2': np.zeros((n, 3)),
+            'dv1_ms': np.zeros(n),
+            'dv2_ms': np.zeros(n),
+            'valid': np.zeros(n, dtype=bool)
+        }
         
-        # Determine if this is a short or long way transfer
-        cross = r1[0] * r2[1] - r1[1] * r2[0]
-        if cross < 0:
-            transfer_angle = 2 * np.pi - transfer_angle
+        # izzo.lambert only accepts a single position pair
+        for i in range(n):
+            solution = self._solve_lambert_poliastro(r1_au[i], r2_au[i], float(tof_days[i]), True)
+            if solution:
+                result['v1'][i] = solution['v1']
+                result['v2'][i] = solution['v2']
+                result['dv1_ms'][i] = solution['dv1_ms']
+                result['dv2_ms'][i] = solution['dv2_ms']
+                result['valid'][i] = True
+        
+        return result
+    
+    def _solve_lambert_bulk_fallback(self, r1_au: np.ndarray, r2_au: np.ndarray,
+                                      tof_days: np.ndarray) -> Dict[str, np.ndarray]:
+        """
+        Fallback Lambert solver using a vectorized Hohmann approximation.
+        Less accurate but works without poliastro.
+        """
+        n = len(tof_days)
+        r1_m = np.sqrt(r1_au[:, 0]**2 + r1_au[:, 1]**2) * AU_M
+        r2_m = np.sqrt(r2_au[:, 0]**2 + r2_au[:, 1]**2) * AU_M
         
-        # Semi-major axis of transfer ellipse
-        a = (r1_mag + r2_mag) / 2
+        dv1 = np.sqrt(SUN_MU / r1_m) * (np.sqrt(2 * r2_m / (r1_m + r2_m)) - 1)
+        dv2 = np.sqrt(SUN_MU / r2_m) * (1 - np.sqrt(2 * r1_m / (r1_m + r2_m)))
         
-        # Eccentricity (approximate for Hohmann-like transfer)
-        e = abs(r2_mag - r1_mag) / (r1_mag + r2_mag)
+        return {
+            'v1': np.zeros((n, 3)),  # Placeholder
+            'v2': np.zeros((n, 3)),
+            'dv1_ms': np.abs(dv1),
+            'dv2_ms': np.abs(dv2),
+            'valid': np.ones(n, dtype=bool)
+        }
+    
+    @staticmethod
+    def _lambert_solution(bulk: Dict[str, np.ndarray], i: int,
+                          r1_au: np.ndarray, r2_au: np.ndarray,
+                          tof_days: float) -> Optional[Dict[str, Any]]:
+        """Build the solve_lambert() result dict for one entry of a bulk solve."""
+        if not bulk['valid'][i]:
+            return None
         
-        # Generate points along the transfer ellipse
-        points = []
+        dv1 = float(bulk['dv1_ms'][i])
+        dv2 = float(bulk['dv2_ms'][i])
+        return {
+            'v1': bulk['v1'][i].tolist(),  # Departure velocity (m/s)
+            'v2': bulk['v2'][i].tolist(),  # Arrival velocity (m/s)
+            'dv1_ms': dv1,  # Departure delta-v (m/s)
+            'dv2_ms': dv2,  # Arrival delta-v (m/s)
+            'total_dv_ms': dv1 + dv2,
+            'total_dv_km_s': (dv1 + dv2) / 1000,
+            'r1_au': r1_au.tolist(),
+            'r2_au': r2_au.tolist(),
+            'tof_days': tof_days
+        }
+    
+    def generate_trajectory_points_bulk(self, r1_au: np.ndarray, r2_au: np.ndarray,
+                                         num_points: int = 50) -> np.ndarray:
+        """
+        Generate trajectory points for many transfers at once.
         
-        # Starting angle (from r1 position)
-        theta1 = np.arctan2(r1[1], r1[0])
+        Uses a conic section approximation to generate points along each transfer orbit.
         
-        for i in range(num_points):
-            # Parametric angle along transfer (0 to transfer_angle)
-            t = i / (num_points - 1)
-            theta = theta1 + t * transfer_angle
-            
-            # Interpolate radius (approximate conic section)
-            # Use a smooth interpolation that accounts for the ellipse shape
-            r1_frac = 1 - t
-            r2_frac = t
-            
-            # For a more accurate conic, use the vis-viva-like interpolation
-            # r = a * (1 - e²) / (1 + e * cos(true_anomaly))
-            # Simplified: interpolate with acceleration toward/away from sun
-            
-            # Quadratic interpolation gives better ellipse approximation
-            # Minimum distance at midpoint for inner transfers
-            if r1_mag > r2_mag:
-                # Inbound transfer - trajectory dips inward
-                r_min = r2_mag
-                r_max = r1_mag
-                # Parabolic interpolation
-                r = r_max - (r_max - r_min) * (4 * t * (1 - t) + t)
-            else:
-                # Outbound transfer - trajectory goes outward
-                r_min = r1_mag
-                r_max = r2_mag
-                # Parabolic interpolation
-                r = r_min + (r_max - r_min) * t
-            
-            # For more realistic Hohmann shape, use ellipse equation
-            # The transfer ellipse has perihelion at min(r1, r2) and aphelion at max(r1, r2)
-            # True anomaly changes from 0° at perihelion to 180° at aphelion
-            
-            # Calculate position
-            x = r * np.cos(theta)
-            y = r * np.sin(theta)
+        Args:
+            r1_au: Departure positions in AU, shape (N, 2)
+            r2_au: Arrival positions in AU, shape (N, 2)
+            num_points: Number of points to generate per transfer
             
-            points.append((float(x), float(y)))
+        Returns:
+            Array of (x, y) positions in AU, shape (N, num_points, 2)
+        """
+        r1_mag = np.linalg.norm(r1_au, axis=1)
+        r2_mag = np.linalg.norm(r2_au, axis=1)
+        
+        # Transfer angle, taking the long way round for clockwise geometry
+        cos_theta = np.einsum('ij,ij->i', r1_au, r2_au) / (r1_mag * r2_mag)
+        transfer_angle = np.arccos(np.clip(cos_theta, -1, 1))
+        cross = r1_au[:, 0] * r2_au[:, 1] - r1_au[:, 1] * r2_au[:, 0]
+        transfer_angle = np.where(cross < 0, 2 * np.pi - transfer_angle, transfer_angle)
+        
+        theta1 = np.arctan2(r1_au[:, 1], r1_au[:, 0])
+        
+        t = np.arange(num_points) / (num_points - 1)
+        theta = theta1[:, None] + t[None, :] * transfer_angle[:, None]
+        
+        # Interpolate the radius: inbound transfers dip inward, outbound ones rise linearly
+        r1_col = r1_mag[:, None]
+        r2_col = r2_mag[:, None]
+        r = np.where(
+            r1_col > r2_col,
+            r1_col - (r1_col - r2_col) * (4 * t * (1 - t) + t),  # Inbound
+            r1_col + (r2_col - r1_col) * t  # Outbound
+        )
         
-        return points
+        return np.stack((r * np.cos(theta), r * np.sin(theta)), axis=-1)
+    
+    # Transfer times tried when searching for the destination's arrival position,
+    # as multiples of the Hohmann transfer time
+    TOF_SEARCH_FACTORS = np.array([0.3, 0.5, 0.7, 0.8, 0.9, 1.0, 1.1, 1.2, 1.3, 1.5, 1.7, 2.0, 2.5])
+    
+    # Transfer result cache size, and the game time bucket width for cache hits
+    TRANSFER_CACHE_SIZE = 4096
+    TRANSFER_CACHE_TIME_RESOLUTION_DAYS = 0.1
+    
+    # Cache misses are handed to an executor in chunks of this many transfers;
+    # pickling overhead outweighs the parallel speedup for fewer
+    PARALLEL_CHUNK_SIZE = 4
     
     def compute_transfer(self, from_zone: str, to_zone: str,
                          game_time_days: float = 0,
                          num_points: int = 50,
-                         planet_positions: Optional[Dict[str, Tuple[float, float]]] = None) -> Dict[str, Any]:
+                         planet_positions: Optional[PlanetPositions] = None) -> Dict[str, Any]:
         """
         Compute a complete transfer trajectory between two zones.
         
@@ -309,111 +368,278 @@ class TrajectorySolver:
             to_zone: Arrival zone ID
             game_time_days: Current game time (for planet positions)
             num_points: Number of trajectory points to generate
-            planet_positions: Optional dict of actual planet positions from frontend
-                              e.g. {"earth": [1.0, 0.0], "mars": [0.5, 1.4]}
+            planet_positions: Optional actual planet positions from frontend
+                              e.g. {"earth": [1.0, 0.0], "mars": [0.5, 1.4]},
+                              or the same packed by pack_planet_positions()
             
         Returns:
             Dictionary with trajectory data and visualization points
+            (trajectory_points_au is a (num_points, 2) float32 numpy array,
+            read-only when served from the result cache)
+        """
+        return self.compute_transfer_bulk(
+            [from_zone], [to_zone], game_time_days, num_points, planet_positions
+        )[0]
+    
+    def compute_transfer_bulk(self, from_zones: Sequence[str], to_zones: Sequence[str],
+                              game_time_days: Union[float, Sequence[float]] = 0,
+                              num_points: int = 50,
+                              planet_positions: Optional[PlanetPositions] = None,
+                              executor: Optional[Executor] = None) -> List[Dict[str, Any]]:
         """
+        Compute transfer trajectories for many zone pairs in one vectorized pass.
+        
+        Positions, transfer times, Lambert solutions and trajectory points are
+        computed as stacked arrays rather than one transfer at a time. Results
+        are cached, so repeat requests for the same transfer skip the solver.
+        
+        Args:
+            from_zones: Departure zone IDs
+            to_zones: Arrival zone IDs, same length as from_zones
+            game_time_days: Current game time, shared or one per transfer
+            num_points: Number of trajectory points to generate per transfer
+            planet_positions: Optional actual planet positions from frontend, dict or packed
+            executor: Optional process pool whose workers solve cache misses in
+                      chunks; see _compute_transfer_chunk()
+            
+        Returns:
+            List of compute_transfer() results, in input order
+        """
+        n = len(from_zones)
+        if np.ndim(game_time_days) == 0:
+            departure_times = [game_time_days] * n
+        else:
+            departure_times = list(game_time_days)
+        
+        # Index the packed positions once; lookups below then gather rows by integer
+        positions = pack_planet_positions(planet_positions)
+        if positions is not None:
+            names, coords = positions
+            positions = ({name: i for i, name in enumerate(names)}, coords)
+        
+        keys = [
+            self._transfer_cache_key(from_zone, to_zone, departure_time, num_points, positions)
+            for from_zone, to_zone, departure_time in zip(from_zones, to_zones, departure_times)
+        ]
+        
+        trajectories = [None] * n
+        misses = []
+        with self._transfer_cache_lock:
+            for i, key in enumerate(keys):
+                cached = self._transfer_cache.get(key)
+                if cached is None:
+                    misses.append(i)
+                    continue
+                self._transfer_cache.move_to_end(key)
+                # Same transfer, departing at this request's exact time
+                trajectories[i] = self._copy_transfer(
+                    cached,
+                    departure_time_days=departure_times[i],
+                    arrival_time_days=departure_times[i] + cached['transfer_time_days']
+                )
+        
+        if misses:
+            miss_from = [from_zones[i] for i in misses]
+            miss_to = [to_zones[i] for i in misses]
+            miss_times = [departure_times[i] for i in misses]
+            if executor is None or len(misses) <= self.PARALLEL_CHUNK_SIZE:
+                computed = self._compute_transfer_bulk(miss_from, miss_to, miss_times, num_points, positions)
+            else:
+                # Misses are independent, so solve them in chunks on the worker processes
+                step = self.PARALLEL_CHUNK_SIZE
+                futures = [
+                    executor.submit(
+                        _compute_transfer_chunk,
+                        miss_from[j:j + step], miss_to[j:j + step], miss_times[j:j + step],
+                        num_points, positions
+                    )
+                    for j in range(0, len(misses), step)
+                ]
+                computed = [traj for future in futures for traj in future.result()]
+            with self._transfer_cache_lock:
+                for i, traj in zip(misses, computed):
+                    trajectories[i] = traj
+                    # Hits share the cached points array, so it must not be writable
+                    points = traj['trajectory_points_au'].copy()
+                    points.flags.writeable = False
+                    self._transfer_cache[keys[i]] = self._copy_transfer(traj, trajectory_points_au=points)
+                while len(self._transfer_cache) > self.TRANSFER_CACHE_SIZE:
+                    self._transfer_cache.popitem(last=False)
+        
+        return trajectories
+    
+    @staticmethod
+    def _copy_transfer(trajectory: Dict[str, Any], **changes: Any) -> Dict[str, Any]:
+        """
+        Copy a compute_transfer() result to or from the cache, with changes applied.
+        
+        Positions and the Lambert solution are copied so callers cannot alter
+        cache entries; the points array is shared.
+        """
+        return dict(
+            trajectory,
+            departure_position_au=list(trajectory['departure_position_au']),
+            arrival_position_au=list(trajectory['arrival_position_au']),
+            lambert_solution=copy.deepcopy(trajectory['lambert_solution']),
+            **changes
+        )
+    
+    def _transfer_cache_key(self, from_zone: str, to_zone: str, game_time_days: float,
+                            num_points: int,
+                            positions: Optional[Tuple[Dict[str, int], np.ndarray]]) -> Hashable:
+        """
+        Build the result cache key for a single transfer.
+        
+        Only the endpoints' provided positions affect a transfer, so the rest of
+        the planet positions are left out of the key.
+        """
+        if positions is None:
+            endpoint_positions = None
+        else:
+            index, coords = positions
+            from_row = index.get(from_zone)
+            to_row = index.get(to_zone)
+            endpoint_positions = (
+                tuple(coords[from_row].tolist()) if from_row is not None else None,
+                tuple(coords[to_row].tolist()) if to_row is not None else None
+            )
+        
+        time_bucket = round(game_time_days / self.TRANSFER_CACHE_TIME_RESOLUTION_DAYS)
+        return (from_zone, to_zone, time_bucket, num_points, endpoint_positions)
+    
+    def _compute_transfer_bulk(self, from_zones: Sequence[str], to_zones: Sequence[str],
+                               departure_times: List[float],
+                               num_points: int,
+                               positions: Optional[Tuple[Dict[str, int], np.ndarray]]) -> List[Dict[str, Any]]:
+        """
+        Uncached compute_transfer_bulk() with one departure time per transfer.
+        
+        positions is None or a (zone ID -> row index, (N, 2) coordinates) pair.
+        """
+        n = len(from_zones)
+        game_times = np.asarray(departure_times, dtype=np.float64)
+        
         # Get orbital radii
-        r1_au = self.get_zone_radius_au(from_zone)
-        r2_au = self.get_zone_radius_au(to_zone)
+        r1_radius = np.array([self.get_zone_radius_au(zone) for zone in from_zones])
+        r2_radius = np.array([self.get_zone_radius_au(zone) for zone in to_zones])
         
         # Calculate Hohmann transfer time (as initial estimate)
-        a = (r1_au + r2_au) / 2  # Semi-major axis in AU
+        a = (r1_radius + r2_radius) / 2  # Semi-major axis in AU
         tof_days = 0.5 * 365.25 * (a ** 1.5)  # Half orbital period
         
-        # Get source position - use provided position if available
-        if planet_positions and from_zone in planet_positions:
-            r1_pos = tuple(planet_positions[from_zone])
-        else:
-            r1_pos = self.get_planet_position(r1_au, game_time_days)
+        # Get source positions - use provided positions where available
+        period_days = 365.25 * (r1_radius ** 1.5)
+        theta1 = 2 * math.pi * (game_times / period_days)
+        r1_pos = np.stack((r1_radius * np.cos(theta1), r1_radius * np.sin(theta1)), axis=-1)
+        if positions is not None:
+            index, coords = positions
+            from_rows = np.array([index.get(zone, -1) for zone in from_zones])
+            provided = from_rows >= 0
+            r1_pos[provided] = coords[from_rows[provided]]
+        
+        # Fall back to optimal Hohmann (180° opposition)
+        theta2 = np.arctan2(r1_pos[:, 1], r1_pos[:, 0]) + math.pi
+        r2_pos = np.stack((r2_radius * np.cos(theta2), r2_radius * np.sin(theta2)), axis=-1)
         
         # For time-dependent trajectory calculation:
         # We know where the source is NOW, but we need to compute where the 
         # destination will be at ARRIVAL time (which depends on transfer time)
-        # This is solved iteratively
-        
-        if planet_positions and to_zone in planet_positions:
-            # Get destination's current position to determine its current orbital angle and radius
-            r2_current = tuple(planet_positions[to_zone])
-            r2_current_mag = math.sqrt(r2_current[0]**2 + r2_current[1]**2)
-            theta2_now = math.atan2(r2_current[1], r2_current[0])
-            
-            print(f"[TrajectorySolver] Using provided destination position for {to_zone}: "
-                  f"current=[{r2_current[0]:.4f}, {r2_current[1]:.4f}] AU, "
-                  f"radius={r2_current_mag:.4f} AU, angle={math.degrees(theta2_now):.1f}°")
-            
-            # Use the actual current radius for orbital period calculation
-            # This ensures we're using the real position, not the zone's nominal radius
-            r2_actual_au = r2_current_mag
-            
-            # Iterate to find where destination will be at arrival
-            # Start with Hohmann TOF as initial guess
-            best_tof = tof_days
-            best_r2_pos = None
-            best_dv = float('inf')
-            
-            # Try different transfer times to find a reasonable solution
-            # Range from 0.3x to 2.5x Hohmann TOF
-            for tof_factor in [0.3, 0.5, 0.7, 0.8, 0.9, 1.0, 1.1, 1.2, 1.3, 1.5, 1.7, 2.0, 2.5]:
-                test_tof = tof_days * tof_factor
-                
-                # Destination's orbital period based on actual current radius
-                period_days = 365.25 * (r2_actual_au ** 1.5)
-                
-                # Destination's angle at arrival time
-                theta2_arrival = theta2_now + 2 * math.pi * (test_tof / period_days)
-                
-                # Destination position at arrival - use actual radius, not zone radius
-                test_r2_pos = (r2_actual_au * math.cos(theta2_arrival), 
-                               r2_actual_au * math.sin(theta2_arrival))
-                
-                # Solve Lambert for this configuration
-                test_result = self.solve_lambert(r1_pos, test_r2_pos, test_tof)
-                
-                if test_result and test_result['total_dv_km_s'] < best_dv:
-                    best_dv = test_result['total_dv_km_s']
-                    best_tof = test_tof
-                    best_r2_pos = test_r2_pos
-            
-            tof_days = best_tof
-            r2_pos = best_r2_pos if best_r2_pos else r2_current
-        else:
-            # Fall back to optimal Hohmann (180° opposition)
-            theta1 = math.atan2(r1_pos[1], r1_pos[0])
-            theta2 = theta1 + math.pi  # 180° away
-            r2_pos = (r2_au * math.cos(theta2), r2_au * math.sin(theta2))
-        
-        arrival_time = game_time_days + tof_days
+        # This is solved by searching over a grid of transfer times
+        if positions is not None:
+            to_rows = np.array([index.get(zone, -1) for zone in to_zones])
+            known = np.flatnonzero(to_rows >= 0)
+            if len(known):
+                self._search_arrival_positions(
+                    known, [to_zones[i] for i in known],
+                    coords[to_rows[known]], r1_pos, r2_pos, tof_days
+                )
+        
+        arrival_times = game_times + tof_days
         
         # Solve Lambert's problem
-        lambert_result = self.solve_lambert(r1_pos, r2_pos, tof_days)
+        lambert = self.solve_lambert_bulk(r1_pos, r2_pos, tof_days)
+        
+        # Generate trajectory points, narrowed to float32 for the frontend: pixel-level
+        # rendering doesn't need float64, and float32 serializes to far shorter literals
+        trajectory_points = self.generate_trajectory_points_bulk(
+            r1_pos, r2_pos, num_points
+        ).astype(np.float32)
+        
+        trajectories = []
+        for i in range(n):
+            lambert_result = self._lambert_solution(lambert, i, r1_pos[i], r2_pos[i], float(tof_days[i]))
+            trajectories.append({
+                'from_zone': from_zones[i],
+                'to_zone': to_zones[i],
+                'departure_time_days': departure_times[i],
+                'arrival_time_days': float(arrival_times[i]),
+                'transfer_time_days': float(tof_days[i]),
+                'departure_position_au': r1_pos[i].tolist(),
+                'arrival_position_au': r2_pos[i].tolist(),
+                'trajectory_points_au': trajectory_points[i],
+                'lambert_solution': lambert_result,
+                'delta_v_km_s': lambert_result['total_dv_km_s'] if lambert_result else None,
+                'used_actual_positions': positions is not None
+            })
+        
+        return trajectories
+    
+    def _search_arrival_positions(self, rows: np.ndarray, to_zones: List[str],
+                                  r2_current: np.ndarray,
+                                  r1_pos: np.ndarray, r2_pos: np.ndarray,
+                                  tof_days: np.ndarray) -> None:
+        """
+        Pick the lowest delta-v transfer time for destinations with known positions.
         
-        # Generate trajectory points
-        trajectory_points = self.generate_trajectory_points(
-            r1_pos, r2_pos, tof_days, num_points
+        Updates r2_pos and tof_days in place for the given rows.
+        """
+        # Destinations' current positions determine their orbital angle and radius
+        # Use the actual current radius for orbital period calculation
+        # This ensures we're using the real position, not the zone's nominal radius
+        r2_actual_au = np.sqrt(r2_current[:, 0]**2 + r2_current[:, 1]**2)
+        theta2_now = np.arctan2(r2_current[:, 1], r2_current[:, 0])
+        
+        for zone, pos, radius, angle in zip(to_zones, r2_current, r2_actual_au, theta2_now):
+            print(f"[TrajectorySolver] Using provided destination position for {zone}: "
+                  f"current=[{pos[0]:.4f}, {pos[1]:.4f}] AU, "
+                  f"radius={radius:.4f} AU, angle={math.degrees(angle):.1f}°")
+        
+        # Try different transfer times to find a reasonable solution
+        # Range from 0.3x to 2.5x Hohmann TOF, shape (M, K)
+        test_tof = tof_days[rows, None] * self.TOF_SEARCH_FACTORS[None, :]
+        
+        # Destinations' angles and positions at arrival time
+        period_days = 365.25 * (r2_actual_au ** 1.5)
+        theta2_arrival = theta2_now[:, None] + 2 * math.pi * (test_tof / period_days[:, None])
+        test_r2_pos = np.stack((r2_actual_au[:, None] * np.cos(theta2_arrival),
+                                r2_actual_au[:, None] * np.sin(theta2_arrival)), axis=-1)
+        
+        # Solve Lambert for every (transfer, time) configuration in one call
+        num_factors = len(self.TOF_SEARCH_FACTORS)
+        test_result = self.solve_lambert_bulk(
+            np.repeat(r1_pos[rows], num_factors, axis=0),
+            test_r2_pos.reshape(-1, 2),
+            test_tof.ravel()
         )
-        
-        return {
-            'from_zone': from_zone,
-            'to_zone': to_zone,
-            'departure_time_days': game_time_days,
-            'arrival_time_days': arrival_time,
-            'transfer_time_days': tof_days,
-            'departure_position_au': list(r1_pos),
-            'arrival_position_au': list(r2_pos),
-            'trajectory_points_au': trajectory_points,
-            'lambert_solution': lambert_result,
-            'delta_v_km_s': lambert_result['total_dv_km_s'] if lambert_result else None,
-            'used_actual_positions': planet_positions is not None
-        }
+        test_dv = np.where(
+            test_result['valid'],
+            (test_result['dv1_ms'] + test_result['dv2_ms']) / 1000,
+            np.inf
+        ).reshape(-1, num_factors)
+        
+        # argmin keeps the earliest factor on ties, like a strict < scan
+        best = np.argmin(test_dv, axis=1)
+        picked = np.arange(len(rows))
+        solved = np.isfinite(test_dv[picked, best])
+        
+        tof_days[rows] = np.where(solved, test_tof[picked, best], tof_days[rows])
+        r2_pos[rows] = np.where(solved[:, None], test_r2_pos[picked, best], r2_current)
     
     def compute_gravity_assist_transfer(self, from_zone: str, to_zone: str,
                                          via_zone: str,
                                          game_time_days: float = 0,
                                          num_points: int = 50,
-                                         planet_positions: Optional[Dict[str, Tuple[float, float]]] = None) -> Dict[str, Any]:
+                                         planet_positions: Optional[PlanetPositions] = None) -> Dict[str, Any]:
         """
         Compute a transfer trajectory using a gravity assist.
         
@@ -423,61 +649,96 @@ class TrajectorySolver:
             via_zone: Intermediate zone for gravity assist
             game_time_days: Current game time
             num_points: Number of trajectory points per leg
-            planet_positions: Optional dict of actual planet positions from frontend
+            planet_positions: Optional actual planet positions from frontend, dict or packed
             
         Returns:
             Dictionary with multi-leg trajectory data
         """
-        # Compute first leg (departure to flyby)
-        leg1 = self.compute_transfer(from_zone, via_zone, game_time_days, num_points // 2, planet_positions)
-        
-        # Compute second leg (flyby to destination)
-        flyby_time = leg1['arrival_time_days']
-        leg2 = self.compute_transfer(via_zone, to_zone, flyby_time, num_points // 2, planet_positions)
-        
-        # Get flyby body mass for gravity assist calculation
-        flyby_mass = self.get_zone_mass_kg(via_zone)
-        
-        # Calculate approximate delta-v savings from gravity assist
-        # This is a simplified model - real gravity assists depend on geometry
-        if flyby_mass > 0:
-            # Gravity assist can provide up to 2 * v_escape * sin(delta/2)
-            # where delta is the turn angle
-            mu_flyby = 6.674e-11 * flyby_mass  # G * M
-            r_flyby = 1e9  # Assume 1000km periapsis (simplified)
-            v_escape_flyby = math.sqrt(2 * mu_flyby / r_flyby) / 1000  # km/s
-            
-            # Estimate delta-v savings (simplified)
-            assist_bonus_km_s = min(v_escape_flyby * 0.5, 5.0)  # Cap at 5 km/s
-        else:
-            assist_bonus_km_s = 0
+        return self.compute_gravity_assist_transfer_bulk(
+            [from_zone], [to_zone], [via_zone], game_time_days, num_points, planet_positions
+        )[0]
+    
+    def compute_gravity_assist_transfer_bulk(self, from_zones: Sequence[str], to_zones: Sequence[str],
+                                             via_zones: Sequence[str],
+                                             game_time_days: float = 0,
+                                             num_points: int = 50,
+                                             planet_positions: Optional[PlanetPositions] = None,
+                                             executor: Optional[Executor] = None) -> List[Dict[str, Any]]:
+        """
+        Compute gravity assist transfers for many zone triples at once.
         
-        # Combine trajectory points
-        all_points = leg1['trajectory_points_au'] + leg2['trajectory_points_au']
+        Each leg is solved with a single compute_transfer_bulk() call.
         
-        # Total delta-v (with gravity assist benefit)
-        total_dv = 0
-        if leg1['lambert_solution']:
-            total_dv += leg1['lambert_solution']['total_dv_km_s']
-        if leg2['lambert_solution']:
-            total_dv += leg2['lambert_solution']['total_dv_km_s']
-        total_dv = max(0, total_dv - assist_bonus_km_s)
+        Args:
+            from_zones: Departure zone IDs
+            to_zones: Final destination zone IDs
+            via_zones: Intermediate zones for gravity assist
+            game_time_days: Current game time
+            num_points: Number of trajectory points per leg
+            planet_positions: Optional actual planet positions from frontend, dict or packed
+            executor: Optional process pool for solving cache misses, as for compute_transfer_bulk()
+            
+        Returns:
+            List of compute_gravity_assist_transfer() results, in input order
+        """
+        # Compute first legs (departure to flyby)
+        leg1s = self.compute_transfer_bulk(
+            from_zones, via_zones, game_time_days, num_points // 2, planet_positions, executor
+        )
         
-        return {
-            'from_zone': from_zone,
-            'to_zone': to_zone,
-            'via_zone': via_zone,
-            'departure_time_days': game_time_days,
-            'flyby_time_days': flyby_time,
-            'arrival_time_days': leg2['arrival_time_days'],
-            'total_transfer_time_days': leg2['arrival_time_days'] - game_time_days,
-            'trajectory_points_au': all_points,
-            'leg1': leg1,
-            'leg2': leg2,
-            'gravity_assist_bonus_km_s': assist_bonus_km_s,
-            'total_delta_v_km_s': total_dv,
-            'is_gravity_assist': True
-        }
+        # Compute second legs (flyby to destination)
+        flyby_times = [leg1['arrival_time_days'] for leg1 in leg1s]
+        leg2s = self.compute_transfer_bulk(
+            via_zones, to_zones, flyby_times, num_points // 2, planet_positions, executor
+        )
+        
+        trajectories = []
+        for from_zone, to_zone, via_zone, leg1, leg2 in zip(from_zones, to_zones, via_zones, leg1s, leg2s):
+            # Get flyby body mass for gravity assist calculation
+            flyby_mass = self.get_zone_mass_kg(via_zone)
+            
+            # Calculate approximate delta-v savings from gravity assist
+            # This is a simplified model - real gravity assists depend on geometry
+            if flyby_mass > 0:
+                # Gravity assist can provide up to 2 * v_escape * sin(delta/2)
+                # where delta is the turn angle
+                mu_flyby = 6.674e-11 * flyby_mass  # G * M
+                r_flyby = 1e9  # Assume 1000km periapsis (simplified)
+                v_escape_flyby = math.sqrt(2 * mu_flyby / r_flyby) / 1000  # km/s
+                
+                # Estimate delta-v savings (simplified)
+                assist_bonus_km_s = min(v_escape_flyby * 0.5, 5.0)  # Cap at 5 km/s
+            else:
+                assist_bonus_km_s = 0
+            
+            # Combine trajectory points
+            all_points = np.concatenate((leg1['trajectory_points_au'], leg2['trajectory_points_au']))
+            
+            # Total delta-v (with gravity assist benefit)
+            total_dv = 0
+            if leg1['lambert_solution']:
+                total_dv += leg1['lambert_solution']['total_dv_km_s']
+            if leg2['lambert_solution']:
+                total_dv += leg2['lambert_solution']['total_dv_km_s']
+            total_dv = max(0, total_dv - assist_bonus_km_s)
+            
+            trajectories.append({
+                'from_zone': from_zone,
+                'to_zone': to_zone,
+                'via_zone': via_zone,
+                'departure_time_days': leg1['departure_time_days'],
+                'flyby_time_days': leg1['arrival_time_days'],
+                'arrival_time_days': leg2['arrival_time_days'],
+                'total_transfer_time_days': leg2['arrival_time_days'] - leg1['departure_time_days'],
+                'trajectory_points_au': all_points,
+                'leg1': leg1,
+                'leg2': leg2,
+                'gravity_assist_bonus_km_s': assist_bonus_km_s,
+                'total_delta_v_km_s': total_dv,
+                'is_gravity_assist': True
+            })
+        
+        return trajectories
 
 
 # Singleton instance
@@ -491,3 +752,18 @@ def get_trajectory_solver(orbital_zones: Optional[Dict] = None) -> TrajectorySol
         _solver_instance = TrajectorySolver(orbital_zones)
     return _solver_instance
 
+
+
+def _compute_transfer_chunk(from_zones: Sequence[str], to_zones: Sequence[str],
+                            departure_times: List[float],
+                            num_points: int,
+                            positions: Optional[Tuple[Dict[str, int], np.ndarray]]) -> List[Dict[str, Any]]:
+    """
+    Solve a chunk of uncached transfers in an executor worker process.
+    
+    Uses the worker's solver singleton, which the pool initializer must have
+    created with the orbital zone data. Results are cached by the calling process.
+    """
+    return get_trajectory_solver()._compute_transfer_bulk(
+        from_zones, to_zones, departure_times, num_points, positions
+    )
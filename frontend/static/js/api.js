@@ -226,6 +226,27 @@ class API {
     }
 
     // Trajectory endpoints
+    /**
+     * Decode base64 float32 trajectory points back into [[x, y], ...] in AU
+     * @param {Object} trajectory - Trajectory from the backend (modified in place)
+     * @returns {Object} The same trajectory, with trajectory_points_au set
+     */
+    decodeTrajectoryPoints(trajectory) {
+        if (!trajectory || typeof trajectory.trajectory_points_au_b64 !== 'string') {
+            return trajectory;
+        }
+        const bytes = Uint8Array.from(atob(trajectory.trajectory_points_au_b64), c => c.charCodeAt(0));
+        const coords = new Float32Array(bytes.buffer);
+        const points = new Array(trajectory.trajectory_points_count);
+        for (let i = 0; i < points.length; i++) {
+            points[i] = [coords[2 * i], coords[2 * i + 1]];
+        }
+        trajectory.trajectory_points_au = points;
+        this.decodeTrajectoryPoints(trajectory.leg1);
+        this.decodeTrajectoryPoints(trajectory.leg2);
+        return trajectory;
+    }
+
     /**
      * Compute a transfer trajectory between two zones using Lambert's problem
      * @param {string} fromZone - Departure zone ID
@@ -255,6 +276,7 @@ class API {
         if (!response.ok) {
             throw new Error(data.error || `HTTP error! status: ${response.status}`);
         }
+        this.decodeTrajectoryPoints(data.trajectory);
         return data;
     }
 
@@ -284,6 +306,7 @@ class API {
         if (!response.ok) {
             throw new Error(data.error || `HTTP error! status: ${response.status}`);
         }
+        this.decodeTrajectoryPoints(data.trajectory);
         return data;
     }
 
@@ -314,6 +337,9 @@ class API {
         if (!response.ok) {
             throw new Error(data.error || `HTTP error! status: ${response.status}`);
         }
+        for (const trajectory of data.trajectories || []) {
+            this.decodeTrajectoryPoints(trajectory);
+        }
         return data;
     }
 
@@ -6,7 +6,7 @@ import sys
 # Add backend to path
 sys.path.insert(0, os.path.dirname(__file__))
 
-from backend.app import create_app
+from backend.app import create_app, warm_up_trajectory_solver
 
 if __name__ == '__main__':
     app = create_app('development')
@@ -18,6 +18,8 @@ if __name__ == '__main__':
         print("Database initialized.")
     
     port = int(os.environ.get('PORT', 5001))
+    warm_up_trajectory_solver(app, use_reloader=True)
+    
     print("Starting Brachisto-Probe game server...")
     print(f"Open http://localhost:{port} in your browser")
     app.run(debug=True, host='0.0.0.0', port=port)